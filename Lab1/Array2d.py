@@ -0,0 +1,226 @@
+from array import array
+from itertools import repeat
+from math import hypot, isnan
+from operator import add, eq, sub, mul, truediv
+from typing import Iterable
+
+from Point2d import Point2d, WIDTH, HEIGHT
+from Vector2d import Vector2d
+
+_NUMERIC_TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd')
+
+
+def find_out_of_bounds(xs: Iterable[float], ys: Iterable[float]) -> list[int]:
+    if not isinstance(xs, (array, memoryview)):
+        xs = array('d', xs)
+    if not isinstance(ys, (array, memoryview)):
+        ys = array('d', ys)
+    if len(xs) != len(ys):
+        raise ValueError("Массивы x и y должны быть одинаковой длины")
+    if not xs or (0 <= min(xs) and max(xs) <= WIDTH and 0 <= min(ys) and max(ys) <= HEIGHT
+                  and not isnan(sum(xs) + sum(ys))):
+        return []
+    return [index for index, (x, y) in enumerate(zip(xs, ys))
+            if not (0 <= x <= WIDTH and 0 <= y <= HEIGHT)]
+
+
+class _Array2d:
+    __slots__ = ("_xs", "_ys")
+    _make_item = None
+
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = ()):
+        xs = array('d', xs)
+        ys = array('d', ys)
+        if len(xs) != len(ys):
+            raise ValueError("Массивы x и y должны быть одинаковой длины")
+        self._xs = memoryview(xs)
+        self._ys = memoryview(ys)
+
+    @classmethod
+    def _from_buffers(cls, xs: memoryview, ys: memoryview):
+        instance = cls.__new__(cls)
+        instance._xs = xs
+        instance._ys = ys
+        return instance
+
+    @classmethod
+    def from_arrays(cls, xs: array | memoryview, ys: array | memoryview):
+        if len(xs) != len(ys):
+            raise ValueError("Массивы x и y должны быть одинаковой длины")
+        return cls._from_buffers(memoryview(xs), memoryview(ys))
+
+    @classmethod
+    def from_iterable(cls, items: Iterable):
+        xs = array('d')
+        ys = array('d')
+        for item in items:
+            xs.append(item.x)
+            ys.append(item.y)
+        return cls._from_buffers(memoryview(xs), memoryview(ys))
+
+    @classmethod
+    def zeros(cls, count: int):
+        return cls._from_buffers(memoryview(array('d', bytes(8 * count))),
+                                 memoryview(array('d', bytes(8 * count))))
+
+    @property
+    def xs(self) -> memoryview:
+        return self._xs
+
+    @property
+    def ys(self) -> memoryview:
+        return self._ys
+
+    def __len__(self):
+        return len(self._xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_buffers(self._xs[index], self._ys[index])
+        return self._make_item(self._xs[index], self._ys[index])
+
+    def __setitem__(self, index, value):
+        self._xs[index] = value.x
+        self._ys[index] = value.y
+
+    def __iter__(self):
+        make_item = self._make_item
+        for x, y in zip(self._xs, self._ys):
+            yield make_item(x, y)
+
+    def __eq__(self, other):
+        if not isinstance(other, _Array2d):
+            return NotImplemented
+        return (len(self) == len(other)
+                and all(map(eq, self._xs, other.xs))
+                and all(map(eq, self._ys, other.ys)))
+
+    def __repr__(self):
+        items = ", ".join(f"({x}, {y})" for x, y in zip(self._xs, self._ys))
+        return f"{type(self).__name__}([{items}])"
+
+
+class Point2dArray(_Array2d):
+    __slots__ = ()
+    _make_item = Point2d.from_trusted
+
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = (), validate: bool = True):
+        super().__init__(xs, ys)
+        if validate:
+            self.validate()
+
+    @classmethod
+    def from_arrays(cls, xs: array | memoryview, ys: array | memoryview, validate: bool = False):
+        points = super().from_arrays(xs, ys)
+        if validate:
+            points.validate()
+        return points
+
+    def out_of_bounds(self) -> list[int]:
+        return find_out_of_bounds(self._xs, self._ys)
+
+    def validate(self) -> None:
+        indices = self.out_of_bounds()
+        if indices:
+            shown = ", ".join(map(str, indices[:10]))
+            if len(indices) > 10:
+                shown += ", ..."
+            raise ValueError(f"{len(indices)} точек вне диапазона {WIDTH}x{HEIGHT}: индексы [{shown}]")
+
+
+class Vector2dArray(_Array2d):
+    __slots__ = ()
+    _make_item = Vector2d
+
+    def _operand(self, other) -> tuple[Iterable[float], Iterable[float]]:
+        if isinstance(other, Vector2dArray):
+            if len(other) != len(self):
+                raise ValueError("Массивы векторов должны быть одинаковой длины")
+            return other.xs, other.ys
+        count = len(self)
+        return repeat(other.x, count), repeat(other.y, count)
+
+    def _scalar(self, number) -> tuple[Iterable[float], Iterable[float]]:
+        if isinstance(number, (int, float)):
+            count = len(self)
+            return repeat(number, count), repeat(number, count)
+        if isinstance(number, (_Array2d, Vector2d, str, bytes)) or not hasattr(number, '__len__'):
+            raise TypeError("Умножение допускается только на число или массив чисел")
+        if isinstance(number, memoryview):
+            numeric = number.ndim == 1 and number.format in _NUMERIC_TYPECODES
+        elif isinstance(number, array):
+            numeric = number.typecode in _NUMERIC_TYPECODES
+        else:
+            numeric = all(isinstance(item, (int, float)) for item in number)
+        if not numeric:
+            raise TypeError("Умножение допускается только на число или массив чисел")
+        if len(number) != len(self):
+            raise ValueError("Массив чисел должен быть той же длины, что и массив векторов")
+        return number, number
+
+    def _apply(self, operation, other_xs, other_ys):
+        return Vector2dArray._from_buffers(memoryview(array('d', map(operation, self._xs, other_xs))),
+                                           memoryview(array('d', map(operation, self._ys, other_ys))))
+
+    def __add__(self, other):
+        return self._apply(add, *self._operand(other))
+
+    def __sub__(self, other):
+        return self._apply(sub, *self._operand(other))
+
+    def __mul__(self, number):
+        return self._apply(mul, *self._scalar(number))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, number):
+        if isinstance(number, (int, float)) and number == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        return self._apply(truediv, *self._scalar(number))
+
+    def __abs__(self) -> array:
+        return array('d', map(hypot, self._xs, self._ys))
+
+    def norms(self) -> array:
+        return abs(self)
+
+    def dot(self, other) -> array:
+        other_xs, other_ys = self._operand(other)
+        return array('d', map(add, map(mul, self._xs, other_xs), map(mul, self._ys, other_ys)))
+
+    def cross(self, other) -> array:
+        other_xs, other_ys = self._operand(other)
+        return array('d', map(sub, map(mul, self._xs, other_ys), map(mul, self._ys, other_xs)))
+
+    def sum(self) -> Vector2d:
+        return Vector2d(sum(self._xs), sum(self._ys))
+
+
+if __name__ == "__main__":
+    points = Point2dArray([1, 2, 3], [4, 5, 6])
+    print(points)
+    print(points[1])
+    view = points[::2]
+    print(view)
+    points[2] = Point2d(30, 60)
+    print(view)
+    vectors = Vector2dArray.from_iterable([Vector2d(1, 2), Vector2d(3, 4)])
+    print(vectors)
+    for vector in vectors:
+        print(repr(vector))
+    print(vectors + Vector2d(1, 1))
+    print(vectors - vectors)
+    print(vectors * 2)
+    print(vectors * [1, 10])
+    print(vectors / 2)
+    print(abs(vectors))
+    print(vectors.dot(Vector2d(1, 0)))
+    print(vectors.cross(vectors[::-1]))
+    print(vectors.sum())
+    trusted = Point2dArray.from_arrays(array('d', [1, 2000, 3, -1]), array('d', [1, 1, 5000, 2]))
+    print(trusted.out_of_bounds())
+    try:
+        trusted.validate()
+    except ValueError as e:
+        print(e)
+    print(repr(Point2d.from_trusted(5, 5)))
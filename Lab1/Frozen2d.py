@@ -0,0 +1,137 @@
+from math import sqrt
+
+from Point2d import Point2d
+from Vector2d import Vector2d
+
+
+class _Frozen2d:
+    __slots__ = ("_x", "_y", "_hash")
+
+    def __init__(self, x: int, y: int):
+        object.__setattr__(self, "_x", x)
+        object.__setattr__(self, "_y", y)
+        object.__setattr__(self, "_hash", hash((x, y)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} является неизменяемым")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} является неизменяемым")
+
+    @property
+    def x(self):
+        return self._x
+
+    @property
+    def y(self):
+        return self._y
+
+    def __getitem__(self, index):
+        return (self._x, self._y)[index]
+
+    def __iter__(self):
+        yield self._x
+        yield self._y
+
+    def __len__(self):
+        return 2
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, _Frozen2d):
+            return (type(self) is type(other) and self._hash == other._hash
+                    and self._x == other._x and self._y == other._y)
+        if isinstance(other, self._mutable):
+            return self._x == other.x and self._y == other.y
+        return NotImplemented
+
+    def __reduce__(self):
+        return type(self), (self._x, self._y)
+
+    def __str__(self):
+        return f"({self._x}, {self._y})"
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._x}, {self._y})"
+
+
+class FrozenPoint2d(_Frozen2d):
+    __slots__ = ()
+    _mutable = Point2d
+    _interned: dict[tuple[int, int], "FrozenPoint2d"] = {}
+
+    def __init__(self, x: int, y: int):
+        Point2d._check_bounds(x, y)
+        super().__init__(x, y)
+
+    @classmethod
+    def from_point(cls, point: Point2d):
+        return cls(point.x, point.y)
+
+    @classmethod
+    def intern(cls, x: int, y: int):
+        if not (isinstance(x, int) and isinstance(y, int)):
+            return cls(x, y)
+        key = (x, y)
+        point = cls._interned.get(key)
+        if point is None:
+            point = cls._interned[key] = cls(x, y)
+        return point
+
+    @classmethod
+    def clear_interned(cls) -> None:
+        cls._interned.clear()
+
+    def thaw(self) -> Point2d:
+        return Point2d.from_trusted(self._x, self._y)
+
+
+class FrozenVector2d(_Frozen2d):
+    __slots__ = ()
+    _mutable = Vector2d
+
+    @classmethod
+    def from_vector(cls, vector: Vector2d):
+        return cls(vector.x, vector.y)
+
+    def thaw(self) -> Vector2d:
+        return Vector2d(self._x, self._y)
+
+    def __abs__(self):
+        return sqrt(self._x**2 + self._y**2)
+
+    def __add__(self, other):
+        return FrozenVector2d(self._x + other.x, self._y + other.y)
+
+    def __sub__(self, other):
+        return FrozenVector2d(self._x - other.x, self._y - other.y)
+
+    def __mul__(self, number):
+        return FrozenVector2d(self._x * number, self._y * number)
+
+    def __truediv__(self, number):
+        if (number == 0):
+            raise ZeroDivisionError("Деление на ноль")
+        return FrozenVector2d(self._x / number, self._y / number)
+
+    def dot(self, vector):
+        return self._x * vector.x + self._y * vector.y
+
+    def cross(self, vector):
+        return self._x * vector.y - self._y * vector.x
+
+
+if __name__ == "__main__":
+    points = [Point2d(1, 2), Point2d(1, 2), Point2d(3, 4)]
+    unique = {FrozenPoint2d.from_point(point) for point in points}
+    print(unique)
+    print(FrozenPoint2d.intern(5, 5) is FrozenPoint2d.intern(5, 5))
+    print(FrozenPoint2d(1, 2) == Point2d(1, 2))
+    cache = {FrozenVector2d(1, 0): "right"}
+    print(cache[FrozenVector2d.from_vector(Vector2d(1, 0))])
+    try:
+        FrozenPoint2d(1, 2)._x = 5
+    except AttributeError as e:
+        print(e)
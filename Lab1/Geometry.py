@@ -0,0 +1,152 @@
+from array import array
+from typing import Sequence
+
+from Array2d import Point2dArray
+from Point2d import Point2d
+from Vector2d import Vector2d
+
+Points = Point2dArray | Sequence[Point2d]
+
+
+def _coords(points: Points) -> tuple[Sequence[float], Sequence[float]]:
+    if isinstance(points, Point2dArray):
+        return points.xs, points.ys
+    return [point.x for point in points], [point.y for point in points]
+
+
+def orientation(a: Point2d, b: Point2d, c: Point2d) -> float:
+    return Vector2d.constructor_from_points(a, b).cross(Vector2d.constructor_from_points(a, c))
+
+
+def convex_hull(points: Points) -> Points:
+    xs, ys = _coords(points)
+    order = []
+    for i in sorted(range(len(xs)), key=lambda i: (xs[i], ys[i])):
+        if not order or xs[i] != xs[order[-1]] or ys[i] != ys[order[-1]]:
+            order.append(i)
+
+    def half(indices):
+        chain = []
+        for i in indices:
+            while len(chain) >= 2:
+                o, a = chain[-2], chain[-1]
+                if (xs[a] - xs[o]) * (ys[i] - ys[o]) - (ys[a] - ys[o]) * (xs[i] - xs[o]) > 0:
+                    break
+                chain.pop()
+            chain.append(i)
+        return chain
+
+    if len(order) < 3:
+        hull = order
+    else:
+        lower = half(order)
+        upper = half(reversed(order))
+        hull = lower[:-1] + upper[:-1]
+
+    if isinstance(points, Point2dArray):
+        return Point2dArray.from_arrays(array('d', (xs[i] for i in hull)),
+                                        array('d', (ys[i] for i in hull)))
+    return [points[i] for i in hull]
+
+
+def signed_area(points: Points) -> float:
+    xs, ys = _coords(points)
+    count = len(xs)
+    if count < 3:
+        return 0.0
+    total = 0.0
+    for i in range(count):
+        j = i + 1 if i + 1 < count else 0
+        total += xs[i] * ys[j] - xs[j] * ys[i]
+    return total / 2
+
+
+def polygon_area(points: Points) -> float:
+    return abs(signed_area(points))
+
+
+def polygon_centroid(points: Points) -> Point2d:
+    xs, ys = _coords(points)
+    count = len(xs)
+    area = 0.0
+    cx = cy = 0.0
+    for i in range(count):
+        j = i + 1 if i + 1 < count else 0
+        cross = xs[i] * ys[j] - xs[j] * ys[i]
+        area += cross
+        cx += (xs[i] + xs[j]) * cross
+        cy += (ys[i] + ys[j]) * cross
+    if area == 0:
+        raise ValueError("Площадь многоугольника равна нулю, центр масс не определён")
+    return Point2d(cx / (3 * area), cy / (3 * area))
+
+
+def _on_segment(px, py, ax, ay, bx, by) -> bool:
+    return min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+
+
+def _intersection(ax, ay, bx, by, cx, cy, dx, dy) -> tuple[float, float] | None:
+    rx, ry = bx - ax, by - ay
+    sx, sy = dx - cx, dy - cy
+    denominator = rx * sy - ry * sx
+    qpx, qpy = cx - ax, cy - ay
+    if denominator == 0:
+        if qpx * ry - qpy * rx != 0:
+            return None
+        for px, py in ((cx, cy), (dx, dy)):
+            if _on_segment(px, py, ax, ay, bx, by):
+                return px, py
+        for px, py in ((ax, ay), (bx, by)):
+            if _on_segment(px, py, cx, cy, dx, dy):
+                return px, py
+        return None
+    t = (qpx * sy - qpy * sx) / denominator
+    u = (qpx * ry - qpy * rx) / denominator
+    if 0 <= t <= 1 and 0 <= u <= 1:
+        return ax + t * rx, ay + t * ry
+    return None
+
+
+def segment_intersections(starts: Points, ends: Points) -> list[tuple[int, int, Point2d]]:
+    start_xs, start_ys = _coords(starts)
+    end_xs, end_ys = _coords(ends)
+    if len(start_xs) != len(end_xs):
+        raise ValueError("Количество начал и концов отрезков должно совпадать")
+
+    left = [min(a, b) for a, b in zip(start_xs, end_xs)]
+    right = [max(a, b) for a, b in zip(start_xs, end_xs)]
+    bottom = [min(a, b) for a, b in zip(start_ys, end_ys)]
+    top = [max(a, b) for a, b in zip(start_ys, end_ys)]
+
+    result = []
+    active: list[int] = []
+    for i in sorted(range(len(left)), key=left.__getitem__):
+        sweep_x = left[i]
+        active = [j for j in active if right[j] >= sweep_x]
+        for j in active:
+            if top[j] < bottom[i] or top[i] < bottom[j]:
+                continue
+            point = _intersection(start_xs[j], start_ys[j], end_xs[j], end_ys[j],
+                                  start_xs[i], start_ys[i], end_xs[i], end_ys[i])
+            if point is not None:
+                first, second = (j, i) if j < i else (i, j)
+                result.append((first, second, Point2d.from_trusted(*point)))
+        active.append(i)
+    result.sort(key=lambda item: (item[0], item[1]))
+    return result
+
+
+if __name__ == "__main__":
+    square = [Point2d(0, 0), Point2d(10, 0), Point2d(10, 10), Point2d(0, 10), Point2d(5, 5), Point2d(3, 7)]
+    print(convex_hull(square))
+    batch = Point2dArray.from_iterable(square)
+    print(convex_hull(batch))
+    hull = convex_hull(square)
+    print(polygon_area(hull), polygon_area(Point2dArray.from_iterable(hull)))
+    print(polygon_centroid(hull))
+    print(orientation(Point2d(0, 0), Point2d(1, 0), Point2d(0, 1)))
+
+    starts = [Point2d(0, 0), Point2d(0, 10), Point2d(20, 20), Point2d(5, 0)]
+    ends = [Point2d(10, 10), Point2d(10, 0), Point2d(30, 30), Point2d(5, 10)]
+    for first, second, point in segment_intersections(starts, ends):
+        print(first, second, point)
@@ -3,15 +3,50 @@ HEIGHT = 1000
 
 
 class Point2d:
-    __slots__ = ("_x", "_y")
+    __slots__ = ("_x", "_y", "_pooled")
+    _FIELDS = ("_x", "_y")
+    _pools: dict[type, list["Point2d"]] = {}
+    POOL_SIZE = 1024
 
     def __init__(self, x: int, y: int):
+        self._check_bounds(x, y)
+        self._x = x
+        self._y = y
+
+    @classmethod
+    def from_trusted(cls, x: int, y: int):
+        point = cls.__new__(cls)
+        point._x = x
+        point._y = y
+        return point
+
+    @staticmethod
+    def _check_bounds(x: int, y: int) -> None:
         if not (0 <= x <= WIDTH):
             raise ValueError(f"x должен быть в диапазоне от 0 до {WIDTH}")
         if not (0 <= y <= HEIGHT):
             raise ValueError(f"y должен быть в диапазоне от 0 до {HEIGHT}")
-        self._x = x
-        self._y = y
+
+    @classmethod
+    def acquire(cls, x: int, y: int):
+        pool = Point2d._pools.get(cls)
+        if pool:
+            cls._check_bounds(x, y)
+            point = pool.pop()
+            point._pooled = False
+            point._x = x
+            point._y = y
+            return point
+        return cls(x, y)
+
+    @classmethod
+    def release(cls, point: "Point2d") -> None:
+        if getattr(point, '_pooled', False):
+            raise ValueError(f"Объект {point!r} уже возвращён в пул")
+        pool = Point2d._pools.setdefault(type(point), [])
+        if len(pool) < cls.POOL_SIZE:
+            point._pooled = True
+            pool.append(point)
 
     @property
     def x(self):
@@ -30,10 +65,10 @@ class Point2d:
         self._y = value
 
     def __getitem__(self, index):
-        return getattr(self, self.__slots__[index])
+        return getattr(self, self._FIELDS[index])
 
     def __setitem__(self, index, value):
-        setattr(self, self.__slots__[index], value)
+        setattr(self, self._FIELDS[index], value)
 
     def __eq__(self, other):
         return self._x == other.x and self._y == other.y
@@ -0,0 +1,142 @@
+import heapq
+from math import hypot
+from typing import Iterable, Iterator
+
+from Point2d import Point2d, WIDTH, HEIGHT
+
+
+class GridIndex:
+    def __init__(self, cell_size: int = 50):
+        if cell_size <= 0:
+            raise ValueError("Размер ячейки должен быть положительным")
+        self._cell_size = cell_size
+        self._columns = WIDTH // cell_size + 1
+        self._rows = HEIGHT // cell_size + 1
+        self._cells: dict[tuple[int, int], list[Point2d]] = {}
+        self._size = 0
+
+    @classmethod
+    def bulk_load(cls, points: Iterable[Point2d], cell_size: int = 50):
+        index = cls(cell_size)
+        cells = index._cells
+        cell_of = index._cell_of
+        for point in points:
+            cells.setdefault(cell_of(point.x, point.y), []).append(point)
+            index._size += 1
+        return index
+
+    @property
+    def cell_size(self) -> int:
+        return self._cell_size
+
+    def _cell_of(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self._cell_size), int(y // self._cell_size)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self) -> Iterator[Point2d]:
+        for bucket in self._cells.values():
+            yield from bucket
+
+    def __contains__(self, point: Point2d) -> bool:
+        return point in self._cells.get(self._cell_of(point.x, point.y), ())
+
+    def insert(self, point: Point2d) -> None:
+        self._cells.setdefault(self._cell_of(point.x, point.y), []).append(point)
+        self._size += 1
+
+    def delete(self, point: Point2d) -> None:
+        cell = self._cell_of(point.x, point.y)
+        bucket = self._cells.get(cell)
+        if not bucket or point not in bucket:
+            raise ValueError(f"Точка {point} отсутствует в индексе")
+        bucket.remove(point)
+        if not bucket:
+            del self._cells[cell]
+        self._size -= 1
+
+    def query_rect(self, x_min: float, y_min: float, x_max: float, y_max: float) -> list[Point2d]:
+        first_column, first_row = self._cell_of(max(x_min, 0), max(y_min, 0))
+        last_column, last_row = self._cell_of(min(x_max, WIDTH), min(y_max, HEIGHT))
+        cells = self._cells
+        result = []
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                bucket = cells.get((column, row))
+                if not bucket:
+                    continue
+                inner = (first_column < column < last_column and first_row < row < last_row)
+                if inner:
+                    result.extend(bucket)
+                else:
+                    result.extend(point for point in bucket
+                                  if x_min <= point.x <= x_max and y_min <= point.y <= y_max)
+        return result
+
+    def query_radius(self, center: Point2d, radius: float) -> list[Point2d]:
+        cx, cy = center.x, center.y
+        candidates = self.query_rect(cx - radius, cy - radius, cx + radius, cy + radius)
+        return [point for point in candidates if hypot(point.x - cx, point.y - cy) <= radius]
+
+    def _ring(self, column: int, row: int, radius: int) -> Iterator[tuple[int, int]]:
+        if radius == 0:
+            yield column, row
+            return
+        for c in range(column - radius, column + radius + 1):
+            yield c, row - radius
+            yield c, row + radius
+        for r in range(row - radius + 1, row + radius):
+            yield column - radius, r
+            yield column + radius, r
+
+    def nearest(self, point: Point2d, k: int = 1) -> list[Point2d]:
+        if k <= 0 or not self._size:
+            return []
+        k = min(k, self._size)
+        qx, qy = point.x, point.y
+        column, row = self._cell_of(qx, qy)
+        size = self._cell_size
+        cells = self._cells
+        heap: list[tuple[float, int, Point2d]] = []
+        max_radius = max(self._columns, self._rows)
+
+        for radius in range(max_radius + 1):
+            for cell in self._ring(column, row, radius):
+                for candidate in cells.get(cell, ()):
+                    distance = hypot(candidate.x - qx, candidate.y - qy)
+                    entry = (-distance, id(candidate), candidate)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif distance < -heap[0][0]:
+                        heapq.heapreplace(heap, entry)
+            covered = min(qx - (column - radius) * size, (column + radius + 1) * size - qx,
+                          qy - (row - radius) * size, (row + radius + 1) * size - qy)
+            if len(heap) == k and -heap[0][0] <= covered:
+                break
+
+        return [candidate for _, _, candidate in sorted(heap, reverse=True)]
+
+
+if __name__ == "__main__":
+    import random
+
+    points = [Point2d(random.randint(0, WIDTH), random.randint(0, HEIGHT)) for _ in range(10000)]
+    index = GridIndex.bulk_load(points, cell_size=25)
+    center = Point2d(500, 500)
+
+    rect = index.query_rect(100, 100, 200, 150)
+    expected = [p for p in points if 100 <= p.x <= 200 and 100 <= p.y <= 150]
+    print(len(rect), len(expected))
+
+    around = index.query_radius(center, 30)
+    expected = [p for p in points if hypot(p.x - 500, p.y - 500) <= 30]
+    print(len(around), len(expected))
+
+    nearest = index.nearest(center, 5)
+    expected = sorted(points, key=lambda p: hypot(p.x - 500, p.y - 500))[:5]
+    print([hypot(p.x - 500, p.y - 500) for p in nearest])
+    print([hypot(p.x - 500, p.y - 500) for p in expected])
+
+    index.delete(nearest[0])
+    print(len(index), nearest[0] in index)
@@ -0,0 +1,128 @@
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable
+
+from Array2d import Point2dArray, Vector2dArray, _Array2d
+
+MAGIC = b"P2D1"
+HEADER = struct.Struct("<4sc3xQ")
+RECORD_SIZE = 16
+
+_KINDS = {b"P": Point2dArray, b"V": Vector2dArray}
+_CODES = {cls: code for code, cls in _KINDS.items()}
+
+
+def _interleave(xs: memoryview, ys: memoryview) -> array:
+    records = array('d', bytes(RECORD_SIZE * len(xs)))
+    view = memoryview(records)
+    view[0::2] = xs if xs.format == 'd' else memoryview(array('d', xs))
+    view[1::2] = ys if ys.format == 'd' else memoryview(array('d', ys))
+    view.release()
+    if sys.byteorder != "little":
+        records.byteswap()
+    return records
+
+
+def save(filename: str, items: _Array2d | Iterable, kind: type[_Array2d] = Point2dArray) -> None:
+    if not isinstance(items, _Array2d):
+        items = kind.from_iterable(items)
+    code = _CODES[type(items)]
+    records = _interleave(items.xs, items.ys)
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, code, len(items)))
+        f.write(records)
+
+
+def _read_header(data) -> tuple[type[_Array2d], int]:
+    if len(data) < HEADER.size:
+        raise ValueError("Файл слишком короткий для заголовка")
+    magic, code, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"Неизвестный формат файла: {magic!r}")
+    if code not in _KINDS:
+        raise ValueError(f"Неизвестный тип данных: {code!r}")
+    if len(data) < HEADER.size + count * RECORD_SIZE:
+        raise ValueError("Файл обрезан: записей меньше, чем указано в заголовке")
+    return _KINDS[code], count
+
+
+def load(filename: str) -> _Array2d:
+    with open(filename, "rb") as f:
+        data = f.read()
+    kind, count = _read_header(data)
+    records = array('d')
+    records.frombytes(data[HEADER.size:HEADER.size + count * RECORD_SIZE])
+    if sys.byteorder != "little":
+        records.byteswap()
+    return kind.from_arrays(records[0::2], records[1::2])
+
+
+class MappedDataset:
+    def __init__(self, filename: str):
+        self._file = open(filename, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Файл {filename} пуст")
+        self._views: list[memoryview] = []
+        kind, count = _read_header(self._mmap)
+        if sys.byteorder == "little":
+            raw = memoryview(self._mmap)[HEADER.size:HEADER.size + count * RECORD_SIZE]
+            records = raw.cast('d')
+            xs, ys = records[0::2], records[1::2]
+            self._views = [ys, xs, records, raw]
+        else:
+            records = array('d')
+            records.frombytes(self._mmap[HEADER.size:HEADER.size + count * RECORD_SIZE])
+            records.byteswap()
+            xs, ys = memoryview(records)[0::2], memoryview(records)[1::2]
+        self._items = kind._from_buffers(xs, ys)
+
+    @property
+    def items(self) -> _Array2d:
+        return self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        for view in self._views:
+            view.release()
+        self._views = []
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self) -> _Array2d:
+        return self._items
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from Point2d import Point2d
+    from Vector2d import Vector2d
+
+    path = os.path.join(tempfile.gettempdir(), "points.p2d")
+    save(path, [Point2d(1, 2), Point2d(3, 4), Point2d(999, 1000)])
+    print(os.path.getsize(path))
+    print(load(path))
+    with MappedDataset(path) as points:
+        print(len(points), points[2], points[1:])
+        print(points.out_of_bounds())
+
+    save(path, [Vector2d(1, -1), Vector2d(0.5, 2)], kind=Vector2dArray)
+    with MappedDataset(path) as vectors:
+        print(abs(vectors))
+    os.remove(path)
@@ -2,7 +2,10 @@ from math import sqrt
 from Point2d import Point2d
 
 class Vector2d:
-    __slots__ = ("_x", "_y")
+    __slots__ = ("_x", "_y", "_pooled")
+    _FIELDS = ("_x", "_y")
+    _pools: dict[type, list["Vector2d"]] = {}
+    POOL_SIZE = 1024
 
     def __init__(self, x: int, y: int):
         self._x = x
@@ -11,6 +14,26 @@ class Vector2d:
     @classmethod
     def constructor_from_points(cls, start: Point2d, end: Point2d):
         return cls(end.x - start.x, end.y - start.y)
+
+    @classmethod
+    def acquire(cls, x: int, y: int):
+        pool = Vector2d._pools.get(cls)
+        if pool:
+            vector = pool.pop()
+            vector._pooled = False
+            vector._x = x
+            vector._y = y
+            return vector
+        return cls(x, y)
+
+    @classmethod
+    def release(cls, vector: "Vector2d") -> None:
+        if getattr(vector, '_pooled', False):
+            raise ValueError(f"Объект {vector!r} уже возвращён в пул")
+        pool = Vector2d._pools.setdefault(type(vector), [])
+        if len(pool) < cls.POOL_SIZE:
+            vector._pooled = True
+            pool.append(vector)
     
     @property
     def x(self):
@@ -29,10 +52,10 @@ class Vector2d:
         self._y = value
     
     def __getitem__(self, index):
-        return getattr(self, self.__slots__[index])
+        return getattr(self, self._FIELDS[index])
 
     def __setitem__(self, index, value):
-        setattr(self, self.__slots__[index], value)
+        setattr(self, self._FIELDS[index], value)
 
     def __iter__(self):
         yield self._x
@@ -66,6 +89,28 @@ class Vector2d:
         if (number == 0):
             raise ZeroDivisionError("Деление на ноль")
         return Vector2d(self._x / number, self._y / number)
+
+    def __iadd__(self, other):
+        self._x += other.x
+        self._y += other.y
+        return self
+
+    def __isub__(self, other):
+        self._x -= other.x
+        self._y -= other.y
+        return self
+
+    def __imul__(self, number):
+        self._x *= number
+        self._y *= number
+        return self
+
+    def __itruediv__(self, number):
+        if (number == 0):
+            raise ZeroDivisionError("Деление на ноль")
+        self._x /= number
+        self._y /= number
+        return self
         
     def dot(self, vector):
         return self._x * vector.x + self._y * vector.y
@@ -110,4 +155,19 @@ if __name__ == "__main__":
     v7 = Vector2d.constructor_from_points(start, end)
     print(v7)
     for i in v1:
-        print(i)
\ No newline at end of file
+        print(i)
+    velocity = Vector2d(1, 1)
+    acceleration = Vector2d(0, -10)
+    position = Vector2d.acquire(0, 0)
+    step = Vector2d.acquire(0, 0)
+    for _ in range(3):
+        step.x, step.y = acceleration.x, acceleration.y
+        step *= 0.1
+        velocity += step
+        step.x, step.y = velocity.x, velocity.y
+        step *= 0.1
+        position += step
+    print(position)
+    Vector2d.release(step)
+    Vector2d.release(position)
+    print(Vector2d.acquire(5, 5) is position)
\ No newline at end of file
@@ -0,0 +1,125 @@
+import json
+import struct
+import sys
+from typing import Dict, Iterator, List, Mapping
+
+MAGIC = b"FNT1"
+HEADER = struct.Struct("<4sH")
+ENTRY = struct.Struct("<B")
+LOCATION = struct.Struct("<II")
+FONT_HEADER = struct.Struct("<HH")
+GLYPH_HEADER = struct.Struct("<IB")
+
+
+def _pack_glyph(rows: List[str]) -> bytes:
+    bits = 0
+    count = 0
+    for row in rows:
+        for cell in row:
+            if cell not in '* ':
+                raise ValueError(f"Недопустимый символ '{cell}' в шаблоне шрифта")
+            bits |= (cell == '*') << count
+            count += 1
+    return bits.to_bytes((count + 7) // 8, 'little')
+
+
+def _unpack_glyph(data: bytes, width: int, height: int) -> List[str]:
+    bits = int.from_bytes(data, 'little')
+    rows = []
+    for row in range(height):
+        offset = row * width
+        rows.append(''.join('*' if bits >> (offset + column) & 1 else ' ' for column in range(width)))
+    return rows
+
+
+def _pack_font(font_data: Dict[str, List[str]]) -> bytes:
+    height = len(next(iter(font_data.values())))
+    parts = [FONT_HEADER.pack(height, len(font_data))]
+    for char, rows in font_data.items():
+        if len(rows) != height:
+            raise ValueError(f"Глиф '{char}' имеет высоту {len(rows)} вместо {height}")
+        width = len(rows[0])
+        if any(len(row) != width for row in rows):
+            raise ValueError(f"Строки глифа '{char}' имеют разную ширину")
+        parts.append(GLYPH_HEADER.pack(ord(char), width))
+        parts.append(_pack_glyph(rows))
+    return b''.join(parts)
+
+
+def compile_fonts(source: str = 'font_templates.json', target: str = 'font_templates.bin') -> None:
+    with open(source, 'r', encoding='utf-8') as f:
+        fonts = json.load(f)
+
+    sections = {name: _pack_font(font_data) for name, font_data in fonts.items()}
+    offset = HEADER.size + sum(ENTRY.size + len(name.encode('utf-8')) + LOCATION.size for name in sections)
+
+    entries = []
+    for name, section in sections.items():
+        encoded = name.encode('utf-8')
+        entries.append(ENTRY.pack(len(encoded)) + encoded + LOCATION.pack(offset, len(section)))
+        offset += len(section)
+
+    with open(target, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(sections)))
+        f.write(b''.join(entries))
+        for section in sections.values():
+            f.write(section)
+
+
+def is_compiled(filename: str) -> bool:
+    with open(filename, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CompiledFont(Mapping[str, Dict[str, List[str]]]):
+    def __init__(self, filename: str = 'font_templates.bin'):
+        self._filename = filename
+        self._locations: Dict[str, tuple[int, int]] = {}
+        self._fonts: Dict[str, Dict[str, List[str]]] = {}
+        with open(filename, 'rb') as f:
+            magic, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Файл {filename} не является скомпилированным шрифтом")
+            for _ in range(count):
+                (length,) = ENTRY.unpack(f.read(ENTRY.size))
+                name = f.read(length).decode('utf-8')
+                self._locations[name] = LOCATION.unpack(f.read(LOCATION.size))
+
+    def _load(self, name: str) -> Dict[str, List[str]]:
+        offset, length = self._locations[name]
+        with open(self._filename, 'rb') as f:
+            f.seek(offset)
+            data = f.read(length)
+
+        height, count = FONT_HEADER.unpack_from(data)
+        position = FONT_HEADER.size
+        glyphs = {}
+        for _ in range(count):
+            code, width = GLYPH_HEADER.unpack_from(data, position)
+            position += GLYPH_HEADER.size
+            size = (width * height + 7) // 8
+            glyphs[chr(code)] = _unpack_glyph(data[position:position + size], width, height)
+            position += size
+        return glyphs
+
+    def __getitem__(self, name: str) -> Dict[str, List[str]]:
+        font = self._fonts.get(name)
+        if font is None:
+            font = self._fonts[name] = self._load(name)
+        return font
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._locations)
+
+    def __len__(self):
+        return len(self._locations)
+
+    def loaded(self) -> List[str]:
+        return list(self._fonts)
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else 'font_templates.json'
+    target = sys.argv[2] if len(sys.argv) > 2 else 'font_templates.bin'
+    compile_fonts(source, target)
+    print(f"Шрифты из {source} скомпилированы в {target}")
@@ -1,6 +1,13 @@
+import io
 import json
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict, Tuple, List
+from typing import Dict, Iterable, Iterator, Mapping, Tuple, List
+
+from FontCompiler import CompiledFont, is_compiled
 
 class Color(Enum):
     RED = '\033[31m'
@@ -14,8 +21,17 @@ class FontSize(Enum):
     MEDIUM = "medium"
     LARGE = "large"
 
+FontTable = Tuple[int, Dict[str, Tuple[str, ...]], Tuple[str, ...]]
+
 class Printer:
-    _font_templates: Dict[str, Dict[str, List[str]]] = {}
+    _font_templates: Mapping[str, Dict[str, List[str]]] = {}
+    _font_tables: Dict[str, FontTable] = {}
+    _glyph_cache: "OrderedDict[Tuple[FontSize, str, str], Tuple[str, ...]]" = OrderedDict()
+    GLYPH_CACHE_SIZE = 1024
+    _local = threading.local()
+    _diff_mode = False
+    _screen: Dict[Tuple[int, int], Tuple[Color, List[str]]] = {}
+    DIFF_MERGE_GAP = 6
     
     def __init__(self, color: Color, position: Tuple[int, int],
                  symbol: str = '*', font_size: FontSize = FontSize.MEDIUM):
@@ -25,48 +41,245 @@ class Printer:
         self.font_size = font_size
     
     def __enter__(self):
-        print('\033[s', end='')
+        self._write('\033[s')
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        print(Color.RESET.value, end='')
-        print('\033[u', end='', flush=True)
+        self._write(Color.RESET.value + '\033[u', flush=True)
+
+    @classmethod
+    def _write(cls, data: str, flush: bool = False):
+        frame = getattr(cls._local, 'frame', None)
+        if frame is not None:
+            frame.write(data)
+            return
+        sys.stdout.write(data)
+        if flush:
+            sys.stdout.flush()
+
+    @classmethod
+    @contextmanager
+    def frame(cls) -> Iterator[io.StringIO]:
+        frame = getattr(cls._local, 'frame', None)
+        if frame is not None:
+            yield frame
+            return
+        cls._local.frame = buffer = io.StringIO()
+        try:
+            yield buffer
+        finally:
+            cls._local.frame = None
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
     
     @classmethod
     def load_font_templates(cls, filename: str = 'font_templates.json'):
-        with open(filename, 'r', encoding='utf-8') as f:
-            cls._font_templates = json.load(f)
+        if is_compiled(filename):
+            cls._font_templates = CompiledFont(filename)
+        else:
+            with open(filename, 'r', encoding='utf-8') as f:
+                cls._font_templates = json.load(f)
+        cls._font_tables = {}
+        cls._glyph_cache.clear()
+
+    @classmethod
+    def _font_table(cls, font_size: FontSize) -> FontTable:
+        table = cls._font_tables.get(font_size.value)
+        if table is None:
+            table = cls._font_tables[font_size.value] = cls._compile_font(cls._font_templates[font_size.value])
+        return table
+
+    @staticmethod
+    def _compile_font(font_data: Dict[str, List[str]]) -> FontTable:
+        height = len(next(iter(font_data.values())))
+        glyphs = {char: tuple(row + ' ' for row in rows) for char, rows in font_data.items()}
+        blank = (' ' * (height + 1),) * height
+        return height, glyphs, blank
+
+    @classmethod
+    def _glyph(cls, font_size: FontSize, char: str, symbol: str) -> Tuple[str, ...]:
+        key = (font_size, char, symbol)
+        cache = cls._glyph_cache
+        glyph = cache.get(key)
+        if glyph is not None:
+            cache.move_to_end(key)
+            return glyph
+
+        _, glyphs, blank = cls._font_table(font_size)
+        rows = glyphs.get(char)
+        if rows is None:
+            glyph = blank
+        elif symbol == '*':
+            glyph = rows
+        else:
+            glyph = tuple(row.replace('*', symbol) for row in rows)
+
+        cache[key] = glyph
+        if len(cache) > cls.GLYPH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return glyph
+
+    @classmethod
+    def _render_rows(cls, text: str, symbol: str, font_size: FontSize) -> List[str]:
+        height = cls._font_table(font_size)[0]
+        glyphs = [cls._glyph(font_size, char, symbol) for char in text.upper()]
+        if not glyphs:
+            return [''] * height
+        return [''.join(row) for row in zip(*glyphs)]
     
     @staticmethod
-    def _move_cursor(x: int, y: int):
-        print(f'\033[{y};{x}H', end='')
+    def _tokens(chunks: Iterable[str], max_length: int) -> Iterator[str]:
+        word: List[str] = []
+        for chunk in chunks:
+            for char in chunk:
+                if char.isspace():
+                    if word:
+                        yield ''.join(word)
+                        word.clear()
+                    if char == '\n':
+                        yield '\n'
+                    continue
+                word.append(char)
+                if len(word) >= max_length:
+                    yield ''.join(word)
+                    word.clear()
+        if word:
+            yield ''.join(word)
+
+    @classmethod
+    def _text_width(cls, text: str, symbol: str, font_size: FontSize) -> int:
+        return sum(len(cls._glyph(font_size, char, symbol)[0]) for char in text.upper())
+
+    @classmethod
+    def _wrap(cls, chunks: Iterable[str], width: int, symbol: str,
+              font_size: FontSize) -> Iterator[str]:
+        space_width = cls._text_width(' ', symbol, font_size)
+        line = ''
+        line_width = 0
+        for token in cls._tokens(chunks, max(width, 1)):
+            if token == '\n':
+                yield line
+                line, line_width = '', 0
+                continue
+            token_width = cls._text_width(token, symbol, font_size)
+            if line and line_width + space_width + token_width <= width:
+                line += ' ' + token
+                line_width += space_width + token_width
+                continue
+            if line:
+                yield line
+            while token_width > width and len(token) > 1:
+                split = 1
+                while (split < len(token)
+                       and cls._text_width(token[:split + 1], symbol, font_size) <= width):
+                    split += 1
+                yield token[:split]
+                token = token[split:]
+                token_width = cls._text_width(token, symbol, font_size)
+            line, line_width = token, token_width
+        if line:
+            yield line
+
+    @classmethod
+    def render_stream(cls, chunks: Iterable[str],
+                      width: int = 80,
+                      symbol: str = '*',
+                      font_size: FontSize = FontSize.MEDIUM) -> Iterator[str]:
+        for line in cls._wrap(chunks, width, symbol, font_size):
+            yield from cls._render_rows(line, symbol, font_size)
+
+    @classmethod
+    def print_stream(cls, chunks: Iterable[str],
+                     color: Color,
+                     position: Tuple[int, int],
+                     width: int = 80,
+                     symbol: str = '*',
+                     font_size: FontSize = FontSize.MEDIUM):
+        for row, line in enumerate(cls.render_stream(chunks, width, symbol, font_size)):
+            cls._write(cls._cursor(position[0], position[1] + row) + color.value + line + Color.RESET.value,
+                       flush=True)
+
+    @staticmethod
+    def _cursor(x: int, y: int) -> str:
+        return f'\033[{y};{x}H'
+
+    @classmethod
+    def _move_cursor(cls, x: int, y: int):
+        cls._write(cls._cursor(x, y))
+
+    @classmethod
+    def render(cls, text: str,
+               color: Color,
+               position: Tuple[int, int],
+               symbol: str = '*',
+               font_size: FontSize = FontSize.MEDIUM) -> str:
+        parts = []
+        for row, line in enumerate(cls._render_rows(text, symbol, font_size)):
+            parts.append(cls._cursor(position[0], position[1] + row))
+            parts.append(color.value)
+            parts.append(line)
+        parts.append(Color.RESET.value)
+        return ''.join(parts)
     
+    @classmethod
+    def set_diff_mode(cls, enabled: bool = True):
+        cls._diff_mode = enabled
+        cls._screen.clear()
+
+    @classmethod
+    def forget_screen(cls):
+        cls._screen.clear()
+
+    @classmethod
+    def _changed_runs(cls, new: str, old: str | None) -> List[Tuple[int, int]]:
+        if old is None:
+            return [(0, len(new))] if new else []
+        runs: List[Tuple[int, int]] = []
+        for column, (new_char, old_char) in enumerate(zip(new, old)):
+            if new_char == old_char:
+                continue
+            if runs and column - runs[-1][1] <= cls.DIFF_MERGE_GAP:
+                runs[-1] = (runs[-1][0], column + 1)
+            else:
+                runs.append((column, column + 1))
+        return runs
+
+    @classmethod
+    def render_diff(cls, text: str,
+                    color: Color,
+                    position: Tuple[int, int],
+                    symbol: str = '*',
+                    font_size: FontSize = FontSize.MEDIUM) -> str:
+        rows = cls._render_rows(text, symbol, font_size)
+        previous = cls._screen.get(position)
+        cls._screen[position] = (color, rows)
+        old_rows = previous[1] if previous else []
+        same_color = previous is not None and previous[0] is color
+
+        parts = []
+        for row in range(max(len(rows), len(old_rows))):
+            new = rows[row] if row < len(rows) else ''
+            old = old_rows[row] if row < len(old_rows) else ''
+            width = max(len(new), len(old))
+            new = new.ljust(width)
+            for start, end in cls._changed_runs(new, old.ljust(width) if same_color else None):
+                parts.append(cls._cursor(position[0] + start, position[1] + row))
+                parts.append(new[start:end])
+
+        if not parts:
+            return ''
+        return color.value + ''.join(parts) + Color.RESET.value
+
     @classmethod
     def print(cls, text: str,
               color: Color,
               position: Tuple[int, int],
               symbol: str = '*',
               font_size: FontSize = FontSize.MEDIUM):
-        text = text.upper()
-        font_data = cls._font_templates[font_size.value]
-        
-        max_height = len(next(iter(font_data.values())))
-        
-        for row in range(max_height):
-            cls._move_cursor(position[0], position[1] + row)
-            print(color.value, end='')
-            
-            line = ''
-            for char in text:
-                if char in font_data:
-                    template_line = font_data[char][row].replace('*', symbol)
-                    line += template_line + ' '
-                else:
-                    line += ' ' * (max_height + 1)
-            
-            print(line, end='')
-        
-        print(Color.RESET.value, end='', flush=True)
+        if cls._diff_mode:
+            cls._write(cls.render_diff(text, color, position, symbol, font_size), flush=True)
+        else:
+            cls._write(cls.render(text, color, position, symbol, font_size), flush=True)
     
     def print_text(self, text: str):
         self.__class__.print(text, self.color, self.position, self.symbol, self.font_size)
@@ -78,4 +291,16 @@ if __name__ == "__main__":
     # Printer.print("Have a nice day", Color.YELLOW, (5, 8), '#')
 
     with Printer(Color.GREEN, (5, 5), '■', FontSize.LARGE) as printer:
-        printer.print_text("Large text")
\ No newline at end of file
+        printer.print_text("Large text")
+
+    with Printer.frame():
+        Printer.print("One", Color.BLUE, (5, 20), '#', FontSize.SMALL)
+        Printer.print("Frame", Color.YELLOW, (25, 20), '@', FontSize.SMALL)
+
+    for row in Printer.render_stream(["Streaming text is wrap", "ped to the given width\nnew line"],
+                                     width=40, font_size=FontSize.SMALL):
+        print(row)
+
+    Printer.set_diff_mode()
+    for status in ("UP 10", "UP 11", "UP 11", "DOWN"):
+        Printer.print(status, Color.GREEN, (5, 26), '#', FontSize.SMALL)
\ No newline at end of file
@@ -0,0 +1,89 @@
+import queue
+import threading
+from typing import Tuple
+
+from Printer import Color, FontSize, Printer
+
+_STOP = object()
+
+
+class RenderQueue:
+    def __init__(self, maxsize: int = 256, batch_size: int = 64):
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._batch_size = batch_size
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run, name="PrinterRenderQueue", daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str,
+               color: Color,
+               position: Tuple[int, int],
+               symbol: str = '*',
+               font_size: FontSize = FontSize.MEDIUM,
+               timeout: float | None = None) -> None:
+        with self._close_lock:
+            if self._closed:
+                raise RuntimeError("Очередь рендеринга закрыта")
+            self._queue.put((text, color, position, symbol, font_size), timeout=timeout)
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _take_batch(self) -> list:
+        batch = [self._queue.get()]
+        while len(batch) < self._batch_size and batch[-1] is not _STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch = self._take_batch()
+            try:
+                with Printer.frame():
+                    for job in batch:
+                        if job is _STOP:
+                            running = False
+                            continue
+                        try:
+                            Printer.print(*job)
+                        except Exception as e:
+                            print(f"[RenderQueue] ОШИБКА при выводе '{job[0]}': {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+if __name__ == "__main__":
+    Printer.load_font_templates()
+
+    def producer(render_queue: RenderQueue, row: int, color: Color):
+        for i in range(5):
+            render_queue.submit(f"T{row} {i}", color, (5, 1 + row * 5), '#', FontSize.SMALL)
+
+    with RenderQueue(maxsize=8) as render_queue:
+        threads = [threading.Thread(target=producer, args=(render_queue, row, color))
+                   for row, color in enumerate((Color.RED, Color.GREEN, Color.BLUE))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        render_queue.flush()
@@ -0,0 +1,126 @@
+import argparse
+import contextlib
+import os
+import socket
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List
+
+from LoggingSystem import (AsyncHandler, BufferedFileHandler, CompiledLogFilter,
+                           ConsoleHandler, FileHandler, LogFilterProtocol,
+                           LogHandlerProtocol, Logger, PersistentSocketHandler,
+                           ReLogFilter, SimpleLogFilter, SocketHandler, SyslogHandler)
+
+
+class TcpSink:
+    def __init__(self, host: str = '127.0.0.1'):
+        self._server = socket.create_server((host, 0))
+        self.host, self.port = self._server.getsockname()[:2]
+        self.received = 0
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="TcpSink", daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while self._running:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._drain, args=(connection,), daemon=True).start()
+
+    def _drain(self, connection: socket.socket) -> None:
+        with connection:
+            while True:
+                try:
+                    data = connection.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                self.received += len(data)
+
+    def close(self) -> None:
+        self._running = False
+        self._server.close()
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def measure(logger: Logger, messages: List[str]) -> Dict[str, float]:
+    latencies = []
+    started = time.perf_counter()
+    for message in messages:
+        call_started = time.perf_counter()
+        logger.log(message)
+        latencies.append(time.perf_counter() - call_started)
+    logger.close()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "messages_per_sec": len(messages) / elapsed if elapsed else 0.0,
+        "p50": _percentile(latencies, 50),
+        "p99": _percentile(latencies, 99),
+    }
+
+
+def _filter_mixes() -> Dict[str, Callable[[], List[LogFilterProtocol]]]:
+    many: Callable[[], List[LogFilterProtocol]] = lambda: (
+            [SimpleLogFilter(f"token{i}") for i in range(100)]
+            + [ReLogFilter(rf"code{i}\d+") for i in range(50)]
+            + [SimpleLogFilter("ERROR")])
+    return {
+        "1 simple": lambda: [SimpleLogFilter("ERROR")],
+        "151 mixed": many,
+        "151 compiled": lambda: [CompiledLogFilter(many())],
+    }
+
+
+def _handlers(sink: TcpSink) -> Dict[str, Callable[[], LogHandlerProtocol]]:
+    return {
+        "ConsoleHandler": ConsoleHandler,
+        "SyslogHandler": SyslogHandler,
+        "FileHandler": lambda: FileHandler("bench.log"),
+        "BufferedFileHandler": lambda: BufferedFileHandler("bench-buffered.log"),
+        "SocketHandler": lambda: SocketHandler(sink.host, sink.port),
+        "PersistentSocketHandler": lambda: PersistentSocketHandler(sink.host, sink.port),
+        "PersistentSocketHandler x64": lambda: PersistentSocketHandler(sink.host, sink.port, batch_size=64),
+        "AsyncHandler(FileHandler)": lambda: AsyncHandler(FileHandler("bench-async.log")),
+    }
+
+
+def run(count: int = 2000) -> List[tuple[str, str, Dict[str, float]]]:
+    messages = [f"ERROR: benchmark message {i}" if i % 2 else f"INFO: benchmark message {i}"
+                for i in range(count)]
+    results = []
+    sink = TcpSink()
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, 'w') as devnull:
+        os.chdir(directory)
+        os.mkdir("Logs")
+        try:
+            for handler_name, handler_factory in _handlers(sink).items():
+                with contextlib.redirect_stdout(devnull):
+                    logger = Logger([SimpleLogFilter("ERROR")], [handler_factory()])
+                    results.append((handler_name, "1 simple", measure(logger, messages)))
+            for filter_name, filters_factory in _filter_mixes().items():
+                logger = Logger(filters_factory(), [])
+                results.append(("(нет обработчиков)", filter_name, measure(logger, messages)))
+        finally:
+            os.chdir(previous)
+            sink.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Измерение производительности Logger")
+    parser.add_argument("-n", "--count", type=int, default=2000, help="количество сообщений на тест")
+    args = parser.parse_args()
+
+    print(f"{'Обработчик':<30} {'Фильтры':<14} {'сообщ./с':>12} {'p50, мкс':>10} {'p99, мкс':>10}")
+    for handler_name, filter_name, result in run(args.count):
+        print(f"{handler_name:<30} {filter_name:<14} {result['messages_per_sec']:>12.0f} "
+              f"{result['p50'] * 1e6:>10.1f} {result['p99'] * 1e6:>10.1f}")
@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import struct
+from typing import Dict, List
+
+from LoggingSystem import BufferedFileHandler
+
+_LENGTH = struct.Struct('>I')
+
+
+class LogCollector:
+    def __init__(self, host: str = 'localhost',
+                 port: int = 12345,
+                 filename: str = "Collected.log",
+                 length_prefixed: bool = False,
+                 batch_size: int = 256,
+                 flush_interval: float = 0.5,
+                 queue_size: int = 10000,
+                 max_frame_size: int = 1024 * 1024):
+        self.host = host
+        self.port = port
+        self.length_prefixed = length_prefixed
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_frame_size = max_frame_size
+        self.received = 0
+        self.connections = 0
+        self._sink = BufferedFileHandler(filename, flush_interval=0)
+        self._queue_size = queue_size
+        self._queue: asyncio.Queue[bytes] | None = None
+        self._server: asyncio.base_events.Server | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(self._queue_size)
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._writer_task = asyncio.create_task(self._write_batches())
+        print(f"[LogCollector] Сервер запущен на {self.host}:{self.port}")
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._clients.values():
+                writer.close()
+            if self._clients:
+                await asyncio.gather(*self._clients, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        if self._writer_task is not None:
+            await self._queue.join()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        self._sink.close()
+
+    async def _read_message(self, reader: asyncio.StreamReader) -> bytes:
+        if not self.length_prefixed:
+            return await reader.readline()
+        try:
+            header = await reader.readexactly(_LENGTH.size)
+        except asyncio.IncompleteReadError:
+            return b''
+        (size,) = _LENGTH.unpack(header)
+        if size > self.max_frame_size:
+            raise ValueError(f"Размер кадра {size} превышает допустимый {self.max_frame_size}")
+        return await reader.readexactly(size)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info('peername')
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        self.connections += 1
+        try:
+            while True:
+                message = await self._read_message(reader)
+                if not message:
+                    break
+                if not self.length_prefixed and not message.endswith(b'\n'):
+                    message += b'\n'
+                self.received += 1
+                await self._queue.put(message)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError) as e:
+            print(f"[LogCollector] ОШИБКА: Соединение {peer} прервано: {e}")
+        finally:
+            self.connections -= 1
+            del self._clients[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _take_batch(self) -> List[bytes]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    def _write(self, batch: List[bytes]) -> None:
+        self._sink.write(b''.join(batch))
+        self._sink.flush()
+
+    async def _write_batches(self) -> None:
+        while True:
+            batch = await self._take_batch()
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception as e:
+                print(f"[LogCollector] ОШИБКА записи: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сборщик журналов от нескольких SocketHandler")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=12345)
+    parser.add_argument("--file", default="Collected.log", help="файл в каталоге ./Logs")
+    parser.add_argument("--length-prefixed", action="store_true",
+                        help="кадры с 4-байтовой длиной (PersistentSocketHandler(length_prefixed=True))")
+    args = parser.parse_args()
+
+    collector = LogCollector(args.host, args.port, args.file, args.length_prefixed)
+    try:
+        asyncio.run(collector.serve_forever())
+    except KeyboardInterrupt:
+        print("[LogCollector] Остановлен")
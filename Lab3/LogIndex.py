@@ -0,0 +1,233 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, List
+
+from LoggingSystem import (LogFilterProtocol, LogRecord, ReLogFilter,
+                           SimpleLogFilter, TIMESTAMP_FORMAT)
+
+_LINE = re.compile(rb'\[(\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}:\d{2})\] ?')
+_TOKEN = re.compile(r'\w+')
+INDEX_VERSION = 2
+HEAD_SIZE = 4096
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN.findall(text.lower()))
+
+
+class LogIndex:
+    def __init__(self, source: str, bucket_seconds: int = 60):
+        self.source = source
+        self.bucket_seconds = bucket_seconds
+        self._indexed_size = 0
+        self._inode = 0
+        self._head = ""
+        self._bucket_keys: List[int] = []
+        self._bucket_offsets: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._parsed: Dict[bytes, float] = {}
+
+    @property
+    def index_path(self) -> str:
+        return self.source + ".idx"
+
+    def _parse_time(self, raw: bytes) -> float:
+        created = self._parsed.get(raw)
+        if created is None:
+            created = datetime.strptime(raw.decode('ascii'), TIMESTAMP_FORMAT).timestamp()
+            if len(self._parsed) > 4096:
+                self._parsed.clear()
+            self._parsed[raw] = created
+        return created
+
+    @staticmethod
+    def _hash_head(f: BinaryIO, size: int) -> str:
+        f.seek(0)
+        return hashlib.sha1(f.read(min(size, HEAD_SIZE))).hexdigest()
+
+    def _replaced(self, f: BinaryIO) -> bool:
+        if not self._indexed_size:
+            return False
+        stat = os.fstat(f.fileno())
+        return (stat.st_ino != self._inode or stat.st_size < self._indexed_size
+                or self._hash_head(f, self._indexed_size) != self._head)
+
+    def _reset(self) -> None:
+        self._indexed_size = 0
+        self._inode = 0
+        self._head = ""
+        self._bucket_keys.clear()
+        self._bucket_offsets.clear()
+        self._postings.clear()
+
+    def update(self) -> int:
+        with open(self.source, 'rb') as f:
+            if self._replaced(f):
+                print(f"[LogIndex] Файл {self.source} был заменён, индекс будет перестроен")
+                self._reset()
+            stat = os.fstat(f.fileno())
+            if stat.st_size == self._indexed_size:
+                return 0
+
+            added = 0
+            f.seek(self._indexed_size)
+            offset = self._indexed_size
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                self._index_line(offset, line)
+                offset += len(line)
+                added += 1
+            self._indexed_size = offset
+            self._inode = stat.st_ino
+            self._head = self._hash_head(f, offset)
+        return added
+
+    def _index_line(self, offset: int, line: bytes) -> None:
+        header = _LINE.match(line)
+        if header:
+            bucket = int(self._parse_time(header.group(1))) // self.bucket_seconds
+            if not self._bucket_keys or bucket > self._bucket_keys[-1]:
+                self._bucket_keys.append(bucket)
+                self._bucket_offsets.append(offset)
+            message = line[header.end():]
+        else:
+            message = line
+        for token in _tokens(message.decode('utf-8', errors='replace')):
+            self._postings.setdefault(token, []).append(offset)
+
+    def save(self) -> None:
+        data = {
+            "version": INDEX_VERSION,
+            "bucket_seconds": self.bucket_seconds,
+            "indexed_size": self._indexed_size,
+            "source": [self._inode, self._head],
+            "buckets": [self._bucket_keys, self._bucket_offsets],
+            "postings": self._postings,
+        }
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def open(cls, source: str, bucket_seconds: int = 60) -> "LogIndex":
+        index = cls(source, bucket_seconds)
+        try:
+            with open(index.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and data["bucket_seconds"] == bucket_seconds:
+                index._indexed_size = data["indexed_size"]
+                index._inode, index._head = data["source"]
+                index._bucket_keys, index._bucket_offsets = data["buckets"]
+                index._postings = data["postings"]
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
+            print(f"[LogIndex] ОШИБКА: Индекс {index.index_path} повреждён и будет перестроен: {e}")
+            index._reset()
+        if index.update():
+            index.save()
+        return index
+
+    def _offset_range(self, start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        first, last = 0, self._indexed_size
+        if start is not None:
+            position = bisect_left(self._bucket_keys, int(start.timestamp()) // self.bucket_seconds)
+            first = self._bucket_offsets[position] if position < len(self._bucket_offsets) else last
+        if end is not None:
+            position = bisect_right(self._bucket_keys, int(end.timestamp()) // self.bucket_seconds)
+            if position < len(self._bucket_offsets):
+                last = self._bucket_offsets[position]
+        return first, last
+
+    def _candidates(self, tokens: set[str], first: int, last: int) -> List[int] | None:
+        if not tokens:
+            return None
+        postings = sorted((self._postings.get(token, []) for token in tokens), key=len)
+        offsets = postings[0][bisect_left(postings[0], first):bisect_left(postings[0], last)]
+        for other in postings[1:]:
+            members = set(other)
+            offsets = [offset for offset in offsets if offset in members]
+        return offsets
+
+    def search(self, start: datetime | None = None,
+               end: datetime | None = None,
+               keywords: List[str] | None = None,
+               filters: List[LogFilterProtocol] | None = None) -> Iterator[LogRecord]:
+        with open(self.source, 'rb') as f:
+            stale = os.fstat(f.fileno()).st_size != self._indexed_size or self._replaced(f)
+        if stale:
+            self.update()
+        if not self._indexed_size:
+            return
+        first, last = self._offset_range(start, end)
+        if first >= last:
+            return
+        tokens = set()
+        for keyword in keywords or []:
+            tokens |= _tokens(keyword)
+        candidates = self._candidates(tokens, first, last)
+        start_time = start.timestamp() if start is not None else None
+        end_time = end.timestamp() if end is not None else None
+
+        with open(self.source, 'rb') as f, \
+                mmap.mmap(f.fileno(), self._indexed_size, access=mmap.ACCESS_READ) as data:
+            offsets = candidates if candidates is not None else self._line_offsets(data, first, last)
+            for offset in offsets:
+                line_end = data.find(b'\n', offset, self._indexed_size)
+                line = data[offset:line_end if line_end != -1 else self._indexed_size]
+                header = _LINE.match(line)
+                if header is None:
+                    continue
+                created = self._parse_time(header.group(1))
+                if start_time is not None and created < start_time:
+                    continue
+                if end_time is not None and created > end_time:
+                    continue
+                message = line[header.end():].decode('utf-8', errors='replace').rstrip('\r')
+                if tokens and not tokens <= _tokens(message):
+                    continue
+                if filters and not any(log_filter.match(message) for log_filter in filters):
+                    continue
+                yield LogRecord(message, created)
+
+    @staticmethod
+    def _line_offsets(data: mmap.mmap, first: int, last: int) -> Iterator[int]:
+        offset = first
+        while offset < last:
+            yield offset
+            line_end = data.find(b'\n', offset, last)
+            if line_end == -1:
+                return
+            offset = line_end + 1
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.strptime(value, TIMESTAMP_FORMAT)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Поиск по журналу с использованием индекса")
+    parser.add_argument("source", nargs="?", default="./Logs/Logs.log")
+    parser.add_argument("--from", dest="start", type=_parse_datetime,
+                        help="начало интервала, например '27.05.2025 21:37:00'")
+    parser.add_argument("--to", dest="end", type=_parse_datetime, help="конец интервала")
+    parser.add_argument("-k", "--keyword", action="append", default=[], help="слово из индекса")
+    parser.add_argument("-s", "--substring", action="append", default=[],
+                        help="подстрока (как SimpleLogFilter)")
+    parser.add_argument("-r", "--regex", action="append", default=[],
+                        help="регулярное выражение (как ReLogFilter)")
+    parser.add_argument("--bucket", type=int, default=60, help="размер временной корзины в секундах")
+    args = parser.parse_args()
+
+    filters: List[LogFilterProtocol] = [SimpleLogFilter(pattern) for pattern in args.substring]
+    filters += [ReLogFilter(pattern) for pattern in args.regex]
+
+    index = LogIndex.open(args.source, args.bucket)
+    for record in index.search(args.start, args.end, args.keyword, filters):
+        print(f"[{record.timestamp}] {record.message}")
@@ -1,16 +1,150 @@
-from typing import Protocol, List
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Protocol, List
+from collections import deque
+from enum import Enum
+import gzip
+import json
+import os
+import queue
+import random
 import re
+import shutil
 import socket
+import struct
+import threading
+import time
 from datetime import datetime
 
 
+TIMESTAMP_FORMAT = "%d.%m.%Y %H:%M:%S"
+
+
+class _TimestampCache:
+    def __init__(self, fmt: str = TIMESTAMP_FORMAT):
+        self.fmt = fmt
+        self._cached: tuple[int, str] = (-1, "")
+
+    def format(self, created: float) -> str:
+        second = int(created)
+        cached_second, text = self._cached
+        if cached_second != second:
+            text = datetime.fromtimestamp(second).strftime(self.fmt)
+            self._cached = (second, text)
+        return text
+
+
+_timestamps = _TimestampCache()
+
+
+class LogLevel(Enum):
+    DEBUG = 10
+    INFO = 20
+    SUCCESS = 25
+    WARNING = 30
+    ERROR = 40
+    CRITICAL = 50
+
+
+_LEVEL_PREFIX = re.compile(r'(DEBUG|INFO|SUCCESS|WARNING|ERROR|CRITICAL)\b')
+
+
+class LogRecord:
+    __slots__ = ("message", "created", "level", "fields", "_timestamp")
+
+    def __init__(self, message: str,
+                 created: float | None = None,
+                 level: LogLevel | None = None,
+                 fields: Dict[str, Any] | None = None):
+        self.message = message
+        self.created = time.time() if created is None else created
+        if level is None:
+            prefix = _LEVEL_PREFIX.match(message)
+            level = LogLevel[prefix.group(1)] if prefix else None
+        self.level = level
+        self.fields = fields or {}
+        self._timestamp: str | None = None
+
+    @classmethod
+    def from_message(cls, message: "str | LogRecord") -> "LogRecord":
+        if isinstance(message, LogRecord):
+            return message
+        return cls(message)
+
+    @property
+    def timestamp(self) -> str:
+        if self._timestamp is None:
+            self._timestamp = _timestamps.format(self.created)
+        return self._timestamp
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        level = self.level.name if self.level else None
+        return f"LogRecord({self.message!r}, {self.created!r}, {level}, {self.fields!r})"
+
+
+class LogFormatterProtocol(Protocol):
+    def encode(self, record: LogRecord) -> bytes:
+        ...
+
+
+class TextFormatter:
+    def encode(self, record: LogRecord) -> bytes:
+        return f"[{record.timestamp}] {record.message}\n".encode('utf-8')
+
+
+class JsonLinesFormatter:
+    def encode(self, record: LogRecord) -> bytes:
+        data = {
+            "time": record.created,
+            "timestamp": record.timestamp,
+            "level": record.level.name if record.level else None,
+            "message": record.message,
+        }
+        if record.fields:
+            data["fields"] = record.fields
+        return (json.dumps(data, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+
+    @staticmethod
+    def decode(line: bytes | str) -> LogRecord:
+        data = json.loads(line)
+        level = LogLevel[data["level"]] if data.get("level") else None
+        return LogRecord(data["message"], data["time"], level, data.get("fields"))
+
+
+class BinaryFormatter:
+    HEADER = struct.Struct("<IdBI")
+
+    def encode(self, record: LogRecord) -> bytes:
+        message = record.message.encode('utf-8')
+        fields = json.dumps(record.fields, ensure_ascii=False, default=str).encode('utf-8') if record.fields else b''
+        size = self.HEADER.size - 4 + len(message) + len(fields)
+        level = record.level.value if record.level else 0
+        return self.HEADER.pack(size, record.created, level, len(message)) + message + fields
+
+    @classmethod
+    def decode(cls, data: bytes) -> Iterator[LogRecord]:
+        position = 0
+        while position + cls.HEADER.size <= len(data):
+            size, created, level, message_size = cls.HEADER.unpack_from(data, position)
+            end = position + 4 + size
+            if end > len(data):
+                break
+            body = position + cls.HEADER.size
+            message = data[body:body + message_size].decode('utf-8')
+            raw_fields = data[body + message_size:end]
+            fields = json.loads(raw_fields) if raw_fields else None
+            yield LogRecord(message, created, LogLevel(level) if level else None, fields)
+            position = end
+
+
 class LogFilterProtocol(Protocol):
     def match(self, message: str) -> bool:
         ...
 
 
 class LogHandlerProtocol(Protocol):
-    def handle(self, message: str) -> None:
+    def handle(self, record: LogRecord) -> None:
         ...
 
 
@@ -37,17 +171,126 @@ class ReLogFilter:
             return False
 
 
+class _AhoCorasick:
+    def __init__(self, patterns: List[str]):
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+        self._build_fail_links()
+
+    def _build_fail_links(self) -> None:
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def search(self, text: str, first_only: bool = False) -> set[int]:
+        goto, fail, output = self._goto, self._fail, self._output
+        found = set(output[0])
+        if found and first_only:
+            return found
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+                if first_only:
+                    return found
+        return found
+
+
+class CompiledLogFilter:
+    _BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+    def __init__(self, filters: List[LogFilterProtocol]):
+        self.filters = list(filters)
+        substrings: List[str] = []
+        self._substring_filters: List[int] = []
+        regexes: List[int] = []
+        self._other_filters: List[int] = []
+        self._combined_filters: List[int] = []
+
+        for index, log_filter in enumerate(self.filters):
+            if type(log_filter) is SimpleLogFilter:
+                substrings.append(log_filter.pattern)
+                self._substring_filters.append(index)
+            elif type(log_filter) is ReLogFilter:
+                if hasattr(log_filter, 'pattern'):
+                    regexes.append(index)
+            else:
+                self._other_filters.append(index)
+
+        self._automaton = _AhoCorasick(substrings)
+        self._combined, self._separate = self._combine(regexes)
+
+    def _combine(self, indices: List[int]) -> tuple[re.Pattern | None, List[int]]:
+        combinable = []
+        separate = []
+        for index in indices:
+            pattern = self.filters[index].pattern
+            if pattern.flags & ~re.UNICODE or self._BACKREFERENCE.search(pattern.pattern):
+                separate.append(index)
+            else:
+                combinable.append(index)
+        if not combinable:
+            return None, separate
+        self._combined_filters = combinable
+        alternation = '|'.join(f'(?:{self.filters[index].pattern.pattern})' for index in combinable)
+        try:
+            return re.compile(alternation), separate
+        except re.error:
+            return None, separate + combinable
+
+    def match(self, message: str) -> bool:
+        if self._automaton.search(message, first_only=True):
+            return True
+        if self._combined is not None and self._combined.search(message):
+            return True
+        return any(self.filters[index].match(message)
+                   for index in self._separate + self._other_filters)
+
+    def matching_filters(self, message: str) -> List[LogFilterProtocol]:
+        matched = {self._substring_filters[position] for position in self._automaton.search(message)}
+        candidates = self._separate + self._other_filters
+        if self._combined is not None and self._combined.search(message):
+            candidates = candidates + self._combined_filters
+        matched.update(index for index in candidates if self.filters[index].match(message))
+        return [self.filters[index] for index in sorted(matched)]
+
+
 class FileHandler:
-    def __init__(self, filename: str, append_mode: bool = True):
+    def __init__(self, filename: str, append_mode: bool = True,
+                 formatter: LogFormatterProtocol | None = None):
         self.filename = filename
-        self.mode = 'a' if append_mode else 'w'
+        self.mode = 'ab' if append_mode else 'wb'
+        self.formatter = formatter or TextFormatter()
 
-    def handle(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-        log = f"[{timestamp}] {message}\n"
+    def handle(self, record: LogRecord | str) -> None:
+        log = self.formatter.encode(LogRecord.from_message(record))
 
         try:
-            with open(f"./Logs/{self.filename}", self.mode, encoding="utf-8") as f:
+            with open(f"./Logs/{self.filename}", self.mode) as f:
                 f.write(log)
                 f.flush()
         except PermissionError:
@@ -56,26 +299,185 @@ class FileHandler:
             print(f"[FileHandler] ОШИБКА: Путь к файлу {self.filename} не найден")
 
 
+class BufferedFileHandler:
+    def __init__(self, filename: str,
+                 append_mode: bool = True,
+                 buffer_size: int = 64 * 1024,
+                 flush_interval: float = 1.0,
+                 max_bytes: int = 0,
+                 rotate_interval: float = 0,
+                 backup_count: int = 5,
+                 compress: bool = False,
+                 formatter: LogFormatterProtocol | None = None):
+        self.filename = filename
+        self.mode = 'ab' if append_mode else 'wb'
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.formatter = formatter or TextFormatter()
+        self.path = f"./Logs/{filename}"
+        self._file: BinaryIO | None = None
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
+        self._file_size = 0
+        self._opened_at = 0.0
+        self._last_flush = time.monotonic()
+        self._compressors: List[threading.Thread] = []
+        self._compressing: set[str] = set()
+        self._last_rotation = ("", 0)
+        self._lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def _open(self) -> BinaryIO:
+        self._file = open(self.path, self.mode)
+        self.mode = 'ab'
+        self._file_size = self._file.tell()
+        self._opened_at = time.monotonic()
+        if self.flush_interval > 0 and self._flusher is None:
+            self._stopped.clear()
+            self._flusher = threading.Thread(target=self._flush_periodically,
+                                             name=f"BufferedFileHandler-{self.filename}",
+                                             daemon=True)
+            self._flusher.start()
+        return self._file
+
+    def handle(self, record: LogRecord | str) -> None:
+        self.write(self.formatter.encode(LogRecord.from_message(record)))
+
+    def write(self, log: bytes) -> None:
+        size = len(log)
+
+        with self._lock:
+            try:
+                if self._file is None:
+                    self._open()
+                if self._should_rotate(size):
+                    self._rotate()
+                self._buffer.append(log)
+                self._buffered_bytes += size
+                self._file_size += size
+                if (self._buffered_bytes >= self.buffer_size
+                        or time.monotonic() - self._last_flush >= self.flush_interval):
+                    self._write_buffer()
+            except PermissionError:
+                print(f"[BufferedFileHandler] ОШИБКА: Нет прав на запись в файл {self.filename}")
+            except FileNotFoundError:
+                print(f"[BufferedFileHandler] ОШИБКА: Путь к файлу {self.filename} не найден")
+
+    def _should_rotate(self, size: int) -> bool:
+        if self.max_bytes and self._file_size and self._file_size + size > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and time.monotonic() - self._opened_at >= self.rotate_interval
+
+    def _write_buffer(self) -> None:
+        if self._buffer and self._file is not None:
+            self._file.write(b''.join(self._buffer))
+            self._file.flush()
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def _rotate(self) -> None:
+        self._write_buffer()
+        self._file.close()
+        self._file = None
+
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        rotated = f"{self.path}.{stamp}"
+        suffix = self._last_rotation[1] + 1 if self._last_rotation[0] == stamp else 0
+        candidate = f"{rotated}.{suffix}" if suffix else rotated
+        while os.path.exists(candidate) or os.path.exists(candidate + ".gz"):
+            suffix += 1
+            candidate = f"{rotated}.{suffix}"
+        self._last_rotation = (stamp, suffix)
+        os.replace(self.path, candidate)
+
+        if self.compress:
+            self._compressing.add(candidate)
+            compressor = threading.Thread(target=self._compress, args=(candidate,), daemon=True)
+            compressor.start()
+            self._compressors = [thread for thread in self._compressors if thread.is_alive()]
+            self._compressors.append(compressor)
+        else:
+            self._remove_old_backups()
+        self._open()
+
+    def _compress(self, path: str) -> None:
+        try:
+            with open(path, 'rb') as source, gzip.open(path + ".gz", 'wb') as target:
+                shutil.copyfileobj(source, target)
+            os.remove(path)
+        except OSError as e:
+            print(f"[BufferedFileHandler] ОШИБКА: Не удалось сжать файл {path}: {e}")
+        self._compressing.discard(path)
+        self._remove_old_backups()
+
+    def _remove_old_backups(self) -> None:
+        if self.backup_count <= 0:
+            return
+        directory, name = os.path.split(self.path)
+        backup_name = re.compile(re.escape(name) + r"(\.(\d{8}-\d{6})(?:\.(\d+))?)(?:\.gz)?")
+        busy = {os.path.basename(path) for path in self._compressing}
+        backups = []
+        for entry in os.scandir(directory):
+            match = backup_name.fullmatch(entry.name)
+            if match and name + match.group(1) not in busy:
+                backups.append(((match.group(2), int(match.group(3) or 0)), entry.path))
+        backups.sort()
+        for _, path in backups[:-self.backup_count]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write_buffer()
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        with self._lock:
+            self._write_buffer()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        for compressor in self._compressors:
+            compressor.join()
+        self._compressors.clear()
+
+
 class SocketHandler:
     def __init__(self, host: str = 'localhost',
                  port: int = 12345,
                  timeout: int = 5,
-                 connection_attempts: int = 3):
+                 connection_attempts: int = 3,
+                 formatter: LogFormatterProtocol | None = None):
         self.host = host
         self.port = port
         self.timeout = timeout
         self.connection_attempts = connection_attempts
+        self.formatter = formatter or TextFormatter()
 
-    def handle(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-        log = f"[{timestamp}] {message}\n"
+    def handle(self, record: LogRecord | str) -> None:
+        log = self.formatter.encode(LogRecord.from_message(record))
 
         for attempt in range(1, self.connection_attempts + 1):
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                     s.settimeout(self.timeout)
                     s.connect((self.host, self.port))
-                    s.send(log.encode('utf-8'))
+                    s.sendall(log)
                     return
             except socket.timeout:
                 print(
@@ -92,40 +494,592 @@ class SocketHandler:
             f"[SocketHandler] ОШИБКА: Не удалось отправить лог после {self.connection_attempts} попыток")
 
 
+class PersistentSocketHandler:
+    def __init__(self, host: str = 'localhost',
+                 port: int = 12345,
+                 timeout: int = 5,
+                 batch_size: int = 1,
+                 length_prefixed: bool = False,
+                 backoff_initial: float = 0.5,
+                 backoff_max: float = 30.0,
+                 max_pending: int = 10000,
+                 max_latency: float = 1.0,
+                 formatter: LogFormatterProtocol | None = None):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.length_prefixed = length_prefixed
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.formatter = formatter or TextFormatter()
+        self.dropped = 0
+        self._socket: socket.socket | None = None
+        self._pending: deque[bytes] = deque()
+        self._max_pending = max_pending
+        self._backoff = backoff_initial
+        self._retry_at = 0.0
+        self._oldest = 0.0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._flusher: threading.Thread | None = None
+
+    def _flush_periodically(self) -> None:
+        interval = self.max_latency / 2 if self.max_latency > 0 else self.backoff_initial
+        while not self._stopped.wait(interval):
+            with self._lock:
+                now = time.monotonic()
+                if not self._pending or now < self._retry_at:
+                    continue
+                if self._retry_at or now - self._oldest >= self.max_latency:
+                    self._send_pending()
+
+    def _start_flusher(self) -> None:
+        if self._pending and self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_periodically,
+                                             name=f"PersistentSocketHandler-{self.host}:{self.port}",
+                                             daemon=True)
+            self._flusher.start()
+
+    def _frame(self, record: LogRecord | str) -> bytes:
+        data = self.formatter.encode(LogRecord.from_message(record))
+        if self.length_prefixed:
+            return struct.pack('>I', len(data)) + data
+        return data
+
+    def _enqueue(self, frame: bytes) -> None:
+        if len(self._pending) >= self._max_pending:
+            self._pending.popleft()
+            self.dropped += 1
+        if not self._pending:
+            self._oldest = time.monotonic()
+        self._pending.append(frame)
+
+    def handle(self, record: LogRecord | str) -> None:
+        with self._lock:
+            self._enqueue(self._frame(record))
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._oldest >= self.max_latency):
+                self._send_pending()
+            self._start_flusher()
+
+    def handle_batch(self, records: List[LogRecord | str]) -> None:
+        with self._lock:
+            for record in records:
+                self._enqueue(self._frame(record))
+            self._send_pending()
+            self._start_flusher()
+
+    def _connect(self) -> socket.socket:
+        connection = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = connection
+        return connection
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
+
+    def _send_pending(self) -> None:
+        if not self._pending or time.monotonic() < self._retry_at:
+            return
+        try:
+            connection = self._socket or self._connect()
+            connection.sendall(b''.join(self._pending))
+            self._pending.clear()
+            self._backoff = self.backoff_initial
+            self._retry_at = 0.0
+        except socket.timeout:
+            self._fail(f"Таймаут подключения к {self.host}:{self.port}")
+        except socket.gaierror as e:
+            self._fail(f"Ошибка разрешения имени {self.host}: {e}")
+        except OSError as e:
+            self._fail(f"Ошибка сокета: {e}")
+
+    def _fail(self, reason: str) -> None:
+        self._disconnect()
+        print(f"[PersistentSocketHandler] {reason}. Повторное подключение через {self._backoff:.1f} с")
+        self._retry_at = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, self.backoff_max)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._retry_at = 0.0
+            self._send_pending()
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.flush()
+        with self._lock:
+            if self._pending:
+                print(f"[PersistentSocketHandler] ОШИБКА: {len(self._pending)} сообщений не отправлено")
+            self._disconnect()
+
+
 class ConsoleHandler:
-    def handle(self, message: str) -> None:
+    def handle(self, record: LogRecord | str) -> None:
         try:
-            timestamp = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-            print(f"[CONSOLE {timestamp}] {message}")
+            record = LogRecord.from_message(record)
+            print(f"[CONSOLE {record.timestamp}] {record.message}")
         except Exception as e:
             print(f"[ConsoleHandler] ОШИБКА: Не удалось вывести сообщение: {e}")
 
 
 class SyslogHandler:
-    def handle(self, message: str) -> None:
+    def handle(self, record: LogRecord | str) -> None:
         try:
-            timestamp = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
-            print(f"[SYSLOG {timestamp}] {message}")
+            record = LogRecord.from_message(record)
+            print(f"[SYSLOG {record.timestamp}] {record.message}")
         except Exception as e:
             print(f"[SyslogHandler] ОШИБКА: Не удалось обработать сообщение: {e}")
 
 
+class OverflowPolicy(Enum):
+    BLOCK = 'block'
+    DROP_NEW = 'drop_new'
+    DROP_OLDEST = 'drop_oldest'
+
+
+_STOP = object()
+
+
+class AsyncHandler:
+    def __init__(self, handler: LogHandlerProtocol,
+                 maxsize: int = 1000,
+                 policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 timeout: float | None = None,
+                 batch_size: int = 100,
+                 stats: "HandlerStats | None" = None):
+        self.handler = handler
+        self.policy = policy
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.stats = stats
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(target=self._run,
+                                        name=f"AsyncHandler-{type(handler).__name__}",
+                                        daemon=True)
+        self._worker.start()
+
+    def handle(self, message: LogRecord | str) -> None:
+        with self._close_lock:
+            if self._closed:
+                print(f"[AsyncHandler] ОШИБКА: Обработчик {type(self.handler).__name__} закрыт")
+                return
+            self._enqueue(message)
+
+    def _enqueue(self, message: LogRecord | str) -> None:
+        if self.policy == OverflowPolicy.BLOCK:
+            try:
+                self._queue.put(message, timeout=self.timeout)
+            except queue.Full:
+                self.dropped += 1
+        elif self.policy == OverflowPolicy.DROP_NEW:
+            try:
+                self._queue.put_nowait(message)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(message)
+                    return
+                except queue.Full:
+                    pass
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def _take_batch(self) -> list:
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size and batch[-1] is not _STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        handle_batch = getattr(self.handler, 'handle_batch', None)
+        while True:
+            batch = self._take_batch()
+            stop = batch[-1] is _STOP
+            messages = batch[:-1] if stop else batch
+            try:
+                if handle_batch is not None:
+                    if messages:
+                        self._call(handle_batch, messages, len(messages))
+                else:
+                    for message in messages:
+                        self._call(self.handler.handle, message, 1)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _call(self, method: Callable[[Any], None], argument: Any, count: int) -> None:
+        failed = False
+        started = time.perf_counter()
+        try:
+            method(argument)
+        except Exception as e:
+            failed = True
+            print(f"Ошибка в обработчике {type(self.handler).__name__}: {e}")
+        if self.stats is not None:
+            elapsed = (time.perf_counter() - started) / count
+            for _ in range(count):
+                self.stats.record(elapsed, failed)
+
+    def flush(self) -> None:
+        self._queue.join()
+        if hasattr(self.handler, 'flush'):
+            self.handler.flush()
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join()
+        if hasattr(self.handler, 'close'):
+            self.handler.close()
+
+
+class LogStageProtocol(Protocol):
+    def process(self, record: LogRecord) -> List[LogRecord]:
+        ...
+
+    def flush(self) -> List[LogRecord]:
+        ...
+
+    def tick(self) -> List[LogRecord]:
+        ...
+
+
+class RateLimitRule:
+    def __init__(self, log_filter: LogFilterProtocol, rate: float, burst: int | None = None):
+        self.filter = log_filter
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.updated: float | None = None
+        self.suppressed = 0
+
+    def allow(self, now: float) -> bool:
+        if self.updated is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        self.suppressed += 1
+        return False
+
+
+class RateLimitStage:
+    def __init__(self, rules: List[RateLimitRule],
+                 summary_interval: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rules = rules
+        self.summary_interval = summary_interval
+        self._clock = clock
+        self._last_summary = clock()
+
+    def process(self, record: LogRecord) -> List[LogRecord]:
+        now = self._clock()
+        result = []
+        for rule in self.rules:
+            if rule.filter.match(record.message):
+                if rule.allow(now):
+                    result.append(record)
+                break
+        else:
+            result.append(record)
+        if now - self._last_summary >= self.summary_interval:
+            result.extend(self.flush())
+        return result
+
+    def tick(self) -> List[LogRecord]:
+        if self._clock() - self._last_summary >= self.summary_interval:
+            return self.flush()
+        return []
+
+    def flush(self) -> List[LogRecord]:
+        self._last_summary = self._clock()
+        summaries = []
+        for rule in self.rules:
+            if rule.suppressed:
+                pattern = getattr(rule.filter, 'pattern', rule.filter)
+                pattern = getattr(pattern, 'pattern', pattern)
+                summaries.append(LogRecord(
+                    f"Ограничение частоты: отброшено {rule.suppressed} сообщений по шаблону '{pattern}'",
+                    fields={"suppressed": rule.suppressed}))
+                rule.suppressed = 0
+        return summaries
+
+
+class SamplingStage:
+    def __init__(self, probability: float,
+                 log_filter: LogFilterProtocol | None = None,
+                 rng: random.Random | None = None):
+        if not 0 <= probability <= 1:
+            raise ValueError("Вероятность выборки должна быть в диапазоне от 0 до 1")
+        self.probability = probability
+        self.filter = log_filter
+        self._random = (rng or random.Random()).random
+        self.dropped = 0
+
+    def process(self, record: LogRecord) -> List[LogRecord]:
+        if self.filter is not None and not self.filter.match(record.message):
+            return [record]
+        if self._random() < self.probability:
+            return [record]
+        self.dropped += 1
+        return []
+
+    def flush(self) -> List[LogRecord]:
+        return []
+
+    def tick(self) -> List[LogRecord]:
+        return []
+
+
+class DeduplicateStage:
+    def __init__(self, summary_interval: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.summary_interval = summary_interval
+        self._clock = clock
+        self._last: LogRecord | None = None
+        self._repeats = 0
+        self._first_repeat = 0.0
+
+    def _summary(self) -> List[LogRecord]:
+        if not self._repeats:
+            return []
+        last = self._last
+        summary = LogRecord(f"Предыдущее сообщение повторено {self._repeats} раз: {last.message}",
+                            level=last.level,
+                            fields={**last.fields, "repeated": self._repeats})
+        self._repeats = 0
+        return [summary]
+
+    def process(self, record: LogRecord) -> List[LogRecord]:
+        now = self._clock()
+        last = self._last
+        if last is not None and last.message == record.message and last.level == record.level:
+            if not self._repeats:
+                self._first_repeat = now
+            self._repeats += 1
+            if now - self._first_repeat >= self.summary_interval:
+                return self._summary()
+            return []
+        result = self._summary()
+        self._last = record
+        result.append(record)
+        return result
+
+    def tick(self) -> List[LogRecord]:
+        if self._repeats and self._clock() - self._first_repeat >= self.summary_interval:
+            return self._summary()
+        return []
+
+    def flush(self) -> List[LogRecord]:
+        return self._summary()
+
+
+class HandlerStats:
+    def __init__(self, samples: int = 1024):
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._samples: deque[float] = deque(maxlen=samples)
+
+    def reset(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._samples.clear()
+
+    def record(self, elapsed: float, failed: bool = False) -> None:
+        self.count += 1
+        self.errors += failed
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        self._samples.append(elapsed)
+
+    def percentile(self, percent: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "mean": self.total_time / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max_time,
+        }
+
+
 class Logger:
     def __init__(self,
                  filters: List[LogFilterProtocol] | None = None,
-                 handlers: List[LogHandlerProtocol] | None = None):
+                 handlers: List[LogHandlerProtocol] | None = None,
+                 async_mode: bool = False,
+                 queue_size: int = 1000,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 compile_filters: bool = False,
+                 stages: List[LogStageProtocol] | None = None,
+                 collect_stats: bool = True,
+                 tick_interval: float = 1.0):
         self.filters = filters or []
+        self.stages = stages or []
+        self.tick_interval = tick_interval
+        self.collect_stats = collect_stats
+        self.received = 0
+        self.filtered_out = 0
+        self._handler_stats: Dict[int, HandlerStats] = {}
+        if compile_filters and self.filters:
+            self.filters = [CompiledLogFilter(self.filters)]
         self.handlers = handlers or []
+        if async_mode:
+            self.handlers = [AsyncHandler(handler, queue_size, overflow_policy,
+                                          stats=self._stats_for(handler) if collect_stats else None)
+                             for handler in self.handlers]
+        self._stages_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._ticker: threading.Thread | None = None
+        if self.stages and tick_interval > 0:
+            self._ticker = threading.Thread(target=self._tick_periodically, name="LoggerTicker", daemon=True)
+            self._ticker.start()
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, level: LogLevel | None = None, **fields: Any) -> None:
+        self.received += 1
         if not any(filter.match(message) for filter in self.filters):
+            self.filtered_out += 1
+            return
+
+        records = [LogRecord(message, level=level, fields=fields)]
+        if self.stages:
+            with self._stages_lock:
+                for stage in self.stages:
+                    records = [result for record in records for result in stage.process(record)]
+
+        for record in records:
+            self._dispatch(record)
+
+    def _dispatch(self, record: LogRecord) -> None:
+        if not self.collect_stats:
+            for handler in self.handlers:
+                try:
+                    handler.handle(record)
+                except Exception as e:
+                    print(f"Ошибка в обработчике {type(handler).__name__}: {e}")
             return
 
         for handler in self.handlers:
+            if isinstance(handler, AsyncHandler) and handler.stats is not None:
+                handler.handle(record)
+                continue
+            failed = False
+            started = time.perf_counter()
             try:
-                handler.handle(message)
+                handler.handle(record)
             except Exception as e:
+                failed = True
                 print(f"Ошибка в обработчике {type(handler).__name__}: {e}")
+            elapsed = time.perf_counter() - started
+            self._stats_for(handler).record(elapsed, failed)
+
+    def _stats_for(self, handler: LogHandlerProtocol) -> HandlerStats:
+        stats = self._handler_stats.get(id(handler))
+        if stats is None:
+            stats = self._handler_stats[id(handler)] = HandlerStats()
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        handlers = {}
+        for index, handler in enumerate(self.handlers):
+            if isinstance(handler, AsyncHandler):
+                stats = handler.stats or self._handler_stats.get(id(handler))
+                result = stats.as_dict() if stats else HandlerStats().as_dict()
+                result["dropped"] = handler.dropped
+                handlers[f"{index}:{type(handler.handler).__name__}"] = result
+                continue
+            stats = self._handler_stats.get(id(handler))
+            handlers[f"{index}:{type(handler).__name__}"] = stats.as_dict() if stats else HandlerStats().as_dict()
+        return {
+            "received": self.received,
+            "filtered_out": self.filtered_out,
+            "handlers": handlers,
+        }
+
+    def reset_stats(self) -> None:
+        self.received = 0
+        self.filtered_out = 0
+        for stats in self._handler_stats.values():
+            stats.reset()
+
+    def _drain_stages(self, method: str) -> None:
+        emitted = []
+        with self._stages_lock:
+            for index, stage in enumerate(self.stages):
+                emit = getattr(stage, method, None)
+                records = emit() if emit is not None else []
+                for next_stage in self.stages[index + 1:]:
+                    records = [result for record in records for result in next_stage.process(record)]
+                emitted.extend(records)
+        for record in emitted:
+            self._dispatch(record)
+
+    def _tick_periodically(self) -> None:
+        while not self._stopped.wait(self.tick_interval):
+            self.tick()
+
+    def tick(self) -> None:
+        self._drain_stages('tick')
+
+    def _flush_stages(self) -> None:
+        self._drain_stages('flush')
+
+    def flush(self) -> None:
+        self._flush_stages()
+        for handler in self.handlers:
+            if hasattr(handler, 'flush'):
+                handler.flush()
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._ticker is not None:
+            self._ticker.join()
+            self._ticker = None
+        self._flush_stages()
+        for handler in self.handlers:
+            if hasattr(handler, 'close'):
+                handler.close()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
-from typing import Protocol, List, Any
+from contextlib import contextmanager
+from typing import Protocol, List, Any, Dict, Iterator
 
 class PropertyChangedListenerProtocol(Protocol):
     def on_property_changed(obj: Any, property_name) -> None:
         ...
 
+class PropertiesChangedListenerProtocol(Protocol):
+    def on_properties_changed(obj: Any, property_names: List[str]) -> None:
+        ...
+
 class DataChangedProtocol(Protocol):
     def add_property_changed_listener(listener: PropertyChangedListenerProtocol):
         ...
@@ -13,6 +18,8 @@ class DataChangedProtocol(Protocol):
 class NotifyDataChanged(DataChangedProtocol):
     def __init__(self):
         self._listeners: List[PropertyChangedListenerProtocol] = []
+        self._batch_depth = 0
+        self._pending_changes: Dict[str, None] = {}
         self._name = ""
         self._age = 0
         self._email = ""
@@ -25,8 +32,33 @@ class NotifyDataChanged(DataChangedProtocol):
             self._listeners.remove(listener)
     
     def _property_changed(self, property_name: str) -> None:
+        if self._batch_depth:
+            self._pending_changes[property_name] = None
+            return
         for listener in self._listeners:
             listener.on_property_changed(self, property_name)
+
+    @contextmanager
+    def batch_update(self) -> Iterator["NotifyDataChanged"]:
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_changes()
+
+    def _flush_changes(self) -> None:
+        property_names = list(self._pending_changes)
+        self._pending_changes.clear()
+        if not property_names:
+            return
+        for listener in list(self._listeners):
+            if hasattr(listener, "on_properties_changed"):
+                listener.on_properties_changed(self, property_names)
+            else:
+                for property_name in property_names:
+                    listener.on_property_changed(self, property_name)
     
     @property
     def name(self):
@@ -142,6 +174,11 @@ class LoggingListener:
         current_value = getattr(obj, property_name)
         print(f"[{self.name}] Свойство '{property_name}' изменено на: {current_value}")
 
+class BatchLoggingListener(LoggingListener):
+    def on_properties_changed(self, obj: Any, property_names: List[str]) -> None:
+        changes = ", ".join(f"{name}={getattr(obj, name)}" for name in property_names)
+        print(f"[{self.name}] Изменены свойства: {changes}")
+
 class NameValidator:
     def on_property_changing(self, obj: Any, property_name: str, old_value: Any, new_value: Any) -> bool:
         if property_name == "name":
@@ -188,6 +225,21 @@ if __name__ == "__main__":
     first_obj.email = "ivan@example.com"
     print("-" * 50, "\n")
 
+    with first_obj.batch_update():
+        first_obj.name = "Пётр"
+        first_obj.age = 26
+        first_obj.age = 27
+    print("-" * 50, "\n")
+
+    batch_logger = BatchLoggingListener("Логгер-пакетный")
+    first_obj.remove_property_changed_listener(logger1)
+    first_obj.add_property_changed_listener(batch_logger)
+    with first_obj.batch_update():
+        first_obj.email = "petr@example.com"
+        first_obj.name = "Пётр Иванов"
+        first_obj.email = "petr.ivanov@example.com"
+    print("-" * 50, "\n")
+
     second_obj.add_property_changed_listener(logger2)
     second_obj.add_property_changing_listener(name_validator)
     second_obj.add_property_changing_listener(age_validator)